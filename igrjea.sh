@@ -61,6 +61,9 @@ LOGIN_RESPONSE=$(curl -s -X POST "$API_URL/auth/login" \
     "password": "admin"
   }')
 echo $LOGIN_RESPONSE | jq '.'
+# Token assinado para as rotas protegidas (Authorization: Bearer ...); o servidor só emite com SECRET_KEY definida
+TOKEN=$(echo $LOGIN_RESPONSE | jq -r '.token')
+AUTH_HEADER="Authorization: Bearer $TOKEN"
 print_success "Login realizado"
 
 print_info "POST /api/auth/login - Login com líder"
@@ -113,12 +116,22 @@ print_success "Membro criado com ID: $MEMBER_ID"
 sleep 1
 
 # READ ALL
-print_info "GET /api/members - Listar todos os membros"
-curl -s -X GET "$API_URL/members" | jq '.'
+print_info "GET /api/members?all=true - Listar todos os membros"
+curl -s -X GET "$API_URL/members?all=true" | jq '.'
 print_success "Lista de membros obtida"
 
 sleep 1
 
+# READ PAGINATED
+print_info "GET /api/members?limit=2&fields=id,name,ebdClassName - Página com campos selecionados"
+PAGE=$(curl -s -X GET "$API_URL/members?limit=2&fields=id,name,ebdClassName")
+echo $PAGE | jq '.'
+NEXT_CURSOR=$(echo $PAGE | jq -r '.nextCursor')
+curl -s -X GET "$API_URL/members?limit=2&fields=id,name,ebdClassName&cursor=$NEXT_CURSOR" | jq '.'
+print_success "Páginas de membros obtidas"
+
+sleep 1
+
 # READ ONE
 print_info "GET /api/members/$MEMBER_ID - Obter membro específico"
 curl -s -X GET "$API_URL/members/$MEMBER_ID" | jq '.'
@@ -133,6 +146,13 @@ print_success "Membros filtrados por ministério"
 
 sleep 1
 
+# SEARCH
+print_info "GET /api/members/search?q=joao - Buscar membro por nome, CPF, telefone ou e-mail"
+curl -s -X GET "$API_URL/members/search?q=joao&fields=id,name,cpf,phone" | jq '.'
+print_success "Busca de membros realizada"
+
+sleep 1
+
 # UPDATE
 print_info "PUT /api/members/$MEMBER_ID - Atualizar membro"
 curl -s -X PUT "$API_URL/members/$MEMBER_ID" \
@@ -166,6 +186,32 @@ print_success "Membros da classe obtidos"
 
 sleep 1
 
+# SYNC - Retrato offline da classe e envio das chamadas feitas sem internet
+print_info "GET /api/ebd-classes/2/sync?weeks=8 - Baixar retrato da classe"
+SNAPSHOT=$(curl -s -X GET "$API_URL/ebd-classes/2/sync?weeks=8" -H "$AUTH_HEADER")
+echo $SNAPSHOT | jq '{version, since, members: (.members | length), attendance: (.attendance | length)}'
+print_info "POST /api/ebd-classes/2/sync - Enviar chamadas offline"
+curl -s -X POST "$API_URL/ebd-classes/2/sync" \
+  -H "$HEADER" \
+  -H "$AUTH_HEADER" \
+  -d '{
+    "changes": [
+      {"memberId": '$MEMBER_ID', "date": "2024-11-24", "serviceType": "ebd", "present": true, "recordedAt": "2024-11-24T09:15:00-03:00"}
+    ]
+  }' | jq '.'
+print_success "Classe sincronizada"
+
+sleep 1
+
+# ROSTER - Chamada da turma com a presença do dia
+print_info "GET /api/ebd-classes/2/roster?date=2024-11-24 - Chamada da classe"
+curl -s -X GET "$API_URL/ebd-classes/2/roster?date=2024-11-24&serviceType=ebd" -H "$AUTH_HEADER" | jq '.'
+print_info "GET /api/ebd-classes/roster?date=2024-11-24 - Chamada de todas as classes"
+curl -s -X GET "$API_URL/ebd-classes/roster?date=2024-11-24&serviceType=ebd" -H "$AUTH_HEADER" | jq '.totals'
+print_success "Chamadas das classes obtidas"
+
+sleep 1
+
 # CREATE NEW CLASS
 print_info "POST /api/ebd-classes - Criar nova classe"
 NEW_CLASS=$(curl -s -X POST "$API_URL/ebd-classes" \
@@ -181,6 +227,24 @@ print_success "Nova classe criada com ID: $CLASS_ID"
 
 sleep 1
 
+# VERIFY CLASS - Token da classe (vale só para as rotas desta classe)
+print_info "POST /api/ebd-classes/verify - Entrar na classe e obter token"
+CLASS_TOKEN=$(curl -s -X POST "$API_URL/ebd-classes/verify" \
+  -H "$HEADER" \
+  -d '{
+    "slug": "salateste",
+    "password": "teste123"
+  }' | jq -r '.token')
+curl -s -X GET "$API_URL/ebd-classes/$CLASS_ID/sync" -H "Authorization: Bearer $CLASS_TOKEN" | jq '{version, class}'
+print_success "Token da classe obtido"
+
+# REFRESH - Renovar token ainda válido
+print_info "POST /api/auth/refresh - Renovar token"
+curl -s -X POST "$API_URL/auth/refresh" -H "$AUTH_HEADER" | jq '{expiresIn}'
+print_success "Token renovado"
+
+sleep 1
+
 # ============================================
 # 5. TRANSACTIONS (CRUD COMPLETO)
 # ============================================
@@ -242,6 +306,35 @@ print_success "Transações filtradas por data"
 
 sleep 1
 
+# READ PAGINATED - Mais recentes primeiro, com totais da página
+print_info "GET /api/transactions?limit=1 - Página com cursor (sem limit/cursor a resposta é a lista completa)"
+PAGE=$(curl -s -X GET "$API_URL/transactions?limit=1")
+echo $PAGE | jq '.'
+NEXT_CURSOR=$(echo $PAGE | jq -r '.nextCursor')
+curl -s -X GET "$API_URL/transactions?limit=1&cursor=$NEXT_CURSOR" | jq '.'
+print_success "Páginas de transações obtidas"
+
+sleep 1
+
+# GIVING - Contribuições por membro
+print_info "GET /api/members/$MEMBER_ID/giving - Histórico e totais anuais do membro"
+curl -s -X GET "$API_URL/members/$MEMBER_ID/giving" | jq '.'
+print_info "GET /api/giving/summary?year=2024 - Contribuições do ano por membro"
+curl -s -X GET "$API_URL/giving/summary?year=2024" | jq '.'
+print_success "Contribuições obtidas"
+
+sleep 1
+
+# IMPORT - Extrato bancário (CSV com valor negativo = despesa)
+print_info "POST /api/transactions/import?dryRun=true - Pré-visualizar extrato"
+printf 'data;historico;valor\n05/11/2024;PIX recebido;150,00\n06/11/2024;Tarifa;-12,90\n' > /tmp/extrato.csv
+curl -s -X POST "$API_URL/transactions/import?dryRun=true" -F "file=@/tmp/extrato.csv" | jq '.'
+print_info "POST /api/transactions/import - Importar extrato (reimportar não duplica)"
+curl -s -X POST "$API_URL/transactions/import" -F "file=@/tmp/extrato.csv" | jq '.'
+print_success "Extrato importado"
+
+sleep 1
+
 # GET SUMMARY
 print_info "GET /api/transactions/summary - Resumo financeiro"
 curl -s -X GET "$API_URL/transactions/summary" | jq '.'
@@ -249,6 +342,13 @@ print_success "Resumo financeiro obtido"
 
 sleep 1
 
+# GET REPORT
+print_info "GET /api/transactions/report?groupBy=month,category - Relatório por mês e categoria"
+curl -s -X GET "$API_URL/transactions/report?groupBy=month,category&startDate=2024-01-01&endDate=2024-12-31" | jq '.'
+print_success "Relatório financeiro obtido"
+
+sleep 1
+
 # ============================================
 # 6. ATTENDANCE (CRUD COMPLETO)
 # ============================================
@@ -297,13 +397,47 @@ print_success "Presença EBD registrada"
 
 sleep 1
 
+# CREATE BATCH - Chamada da turma inteira
+print_info "POST /api/attendance/batch - Chamada em lote"
+curl -s -X POST "$API_URL/attendance/batch" \
+  -H "$HEADER" \
+  -d '{
+    "date": "2024-11-24",
+    "serviceType": "ebd",
+    "records": [
+      {"memberId": '$MEMBER_ID', "present": true}
+    ]
+  }' | jq '.'
+print_success "Chamada em lote registrada"
+
+sleep 1
+
+# CALENDAR - Presenças do membro no ano (heatmap)
+print_info "GET /api/members/$MEMBER_ID/attendance/calendar?year=2024 - Calendário de presença"
+curl -s -X GET "$API_URL/members/$MEMBER_ID/attendance/calendar?year=2024" | jq '.'
+print_info "GET /api/attendance/present?serviceType=ebd&dates=... - Presentes em todas as datas"
+curl -s -X GET "$API_URL/attendance/present?serviceType=ebd&dates=2024-11-21,2024-11-24" | jq '.'
+print_success "Calendário de presença obtido"
+
+sleep 1
+
 # READ ALL
-print_info "GET /api/attendance - Listar todas as presenças"
+print_info "GET /api/attendance - Listar todas as presenças (array completo; paginação só com limit/cursor)"
 curl -s -X GET "$API_URL/attendance" | jq '.'
 print_success "Presenças listadas"
 
 sleep 1
 
+# READ PAGINATED - Por (date, id), com intervalo de datas e membro
+print_info "GET /api/attendance?limit=2&memberId=$MEMBER_ID&startDate=2024-11-01 - Página com cursor"
+PAGE=$(curl -s -X GET "$API_URL/attendance?limit=2&memberId=$MEMBER_ID&startDate=2024-11-01")
+echo $PAGE | jq '.'
+NEXT_CURSOR=$(echo $PAGE | jq -r '.nextCursor')
+curl -s -X GET "$API_URL/attendance?limit=2&memberId=$MEMBER_ID&startDate=2024-11-01&cursor=$NEXT_CURSOR" | jq '.'
+print_success "Páginas de presença obtidas"
+
+sleep 1
+
 # READ WITH FILTER - Por data
 print_info "GET /api/attendance?date=2024-11-21 - Filtrar por data"
 curl -s -X GET "$API_URL/attendance?date=2024-11-21" | jq '.'
@@ -374,9 +508,16 @@ sleep 1
 print_section "10. DELETE OPERATIONS"
 
 # DELETE MEMBER
-print_info "DELETE /api/members/$MEMBER_ID - Deletar membro de teste"
+print_info "DELETE /api/members/$MEMBER_ID - Marcar membro de teste como \"Saiu\""
 curl -s -X DELETE "$API_URL/members/$MEMBER_ID"
-print_success "Membro deletado"
+curl -s -X GET "$API_URL/members/$MEMBER_ID" | jq '.status'
+print_success "Membro marcado como Saiu"
+
+sleep 1
+
+print_info "DELETE /api/members/$MEMBER_ID?purge=true - Agendar exclusão definitiva"
+curl -s -X DELETE "$API_URL/members/$MEMBER_ID?purge=true" | jq '.'
+print_success "Exclusão definitiva agendada"
 
 sleep 1
 